@@ -15,6 +15,7 @@ class Results(object):
         parameter estimates from the fit model
     """
     def __init__(self, model, params, **kwd):
+        self._cache = {}
         self.__dict__.update(kwd)
         self.initialize(model, params, **kwd)
         self._data_attr = []
@@ -193,21 +194,9 @@ class LikelihoodModelResults(Results):
                 self.use_t = use_t
         if 'cov_type' in kwargs:
             cov_type = kwargs.get('cov_type', 'nonrobust')
-            cov_kwds = kwargs.get('cov_kwds', {})
-
-            if cov_type == 'nonrobust':
-                self.cov_type = 'nonrobust'
-                self.cov_kwds = {'description' : 'Standard Errors assume that the ' +
-                                 'covariance matrix of the errors is correctly ' +
-                                 'specified.'}
-            else:
-                from statsmodels.base.covtype import get_robustcov_results
-                if cov_kwds is None:
-                    cov_kwds = {}
-                use_t = self.use_t
-                # TODO: we shouldn't need use_t in get_robustcov_results
-                get_robustcov_results(self, cov_type=cov_type, use_self=True,
-                                           use_t=use_t, **cov_kwds)
+            cov_kwds = kwargs.get('cov_kwds') or {}
+            self._get_robustcov_results(cov_type=cov_type, use_self=True,
+                                        use_t=self.use_t, **cov_kwds)
 
 
     def normalized_cov_params(self):
@@ -216,16 +205,13 @@ class LikelihoodModelResults(Results):
 
     def _get_robustcov_results(self, cov_type='nonrobust', use_self=True,
                                    use_t=None, **cov_kwds):
-        from statsmodels.base.covtype import get_robustcov_results
-        if cov_kwds is None:
-            cov_kwds = {}
-
         if cov_type == 'nonrobust':
             self.cov_type = 'nonrobust'
             self.cov_kwds = {'description' : 'Standard Errors assume that the ' +
                              'covariance matrix of the errors is correctly ' +
                              'specified.'}
         else:
+            from statsmodels.base.covtype import get_robustcov_results
             # TODO: we shouldn't need use_t in get_robustcov_results
             get_robustcov_results(self, cov_type=cov_type, use_self=True,
                                        use_t=use_t, **cov_kwds)
@@ -236,7 +222,12 @@ class LikelihoodModelResults(Results):
 
     @cache_readonly
     def bse(self):
-        return np.sqrt(np.diag(self.cov_params()))
+        if (hasattr(self, 'cov_params_default') or
+                self.normalized_cov_params is None):
+            return np.sqrt(np.diag(self.cov_params()))
+        # only the k variances are needed, so scale the diagonal rather than
+        # the full covariance matrix
+        return np.sqrt(self.scale * np.diag(self.normalized_cov_params))
 
     @cache_readonly
     def tvalues(self):
@@ -292,12 +283,6 @@ class LikelihoodModelResults(Results):
         OR
         ``(scale) * (X.T X)^(-1)[column][:,column]`` if column is 1d
         """
-        if (hasattr(self, 'mle_settings') and
-                self.mle_settings['optimizer'] in ['l1', 'l1_cvxopt_cp']):
-            dot_fun = nan_dot
-        else:
-            dot_fun = np.dot
-
         if (cov_p is None and self.normalized_cov_params is None and
             not hasattr(self, 'cov_params_default')):
             raise ValueError('need covariance of parameters for computing '
@@ -331,7 +316,7 @@ class LikelihoodModelResults(Results):
                 other = r_matrix
             else:
                 other = np.asarray(other)
-            tmp = dot_fun(r_matrix, dot_fun(cov_p, np.transpose(other)))
+            tmp = np.dot(r_matrix, np.dot(cov_p, np.transpose(other)))
             return tmp
         else:  # if r_matrix is None and column is None:
             return cov_p
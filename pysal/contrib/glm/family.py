@@ -297,18 +297,6 @@ class Poisson(Family):
         self.variance = Poisson.variance
         self.link = link()
 
-    def _clean(self, x):
-        """
-        Helper function to trim the data so that is in (0,inf)
-
-        Notes
-        -----
-        The need for this function was discovered through usage and its
-        possible that other families might need a check for validity of the
-        domain.
-        """
-        return np.clip(x, FLOAT_EPS, np.inf)
-
     def resid_dev(self, endog, mu, scale=1.):
         r"""Poisson deviance residual
 
@@ -334,9 +322,9 @@ class Poisson(Family):
            resid\_dev_i = sign(Y_i - \mu_i) * \sqrt{2 *
                           (Y_i * \log(Y_i / \mu_i) - (Y_i - \mu_i))} / scale
         """
-        endog_mu = self._clean(endog / mu)
         return (np.sign(endog - mu) *
-                np.sqrt(2 * (endog * np.log(endog_mu) - (endog - mu))) / scale)
+                np.sqrt(2 * (special.xlogy(endog, endog / mu) - (endog - mu))) /
+                scale)
 
     def deviance(self, endog, mu, freq_weights=1., scale=1.):
         r'''
@@ -367,8 +355,7 @@ class Poisson(Family):
 
            D = 2 * \sum_i (freq\_weights_i * Y_i * \log(Y_i / \mu_i))/ scale
         '''
-        endog_mu = self._clean(endog / mu)
-        return 2 * np.sum(endog * freq_weights * np.log(endog_mu)) / scale
+        return 2 * np.sum(freq_weights * special.xlogy(endog, endog / mu)) / scale
 
     def loglike(self, endog, mu, freq_weights=1., scale=1.):
         r"""
@@ -461,18 +448,6 @@ class QuasiPoisson(Family):
         self.variance = Poisson.variance
         self.link = link()
 
-    def _clean(self, x):
-        """
-        Helper function to trim the data so that is in (0,inf)
-
-        Notes
-        -----
-        The need for this function was discovered through usage and its
-        possible that other families might need a check for validity of the
-        domain.
-        """
-        return np.clip(x, FLOAT_EPS, np.inf)
-
     def resid_dev(self, endog, mu, scale=1.):
         r"""Poisson deviance residual
 
@@ -498,9 +473,9 @@ class QuasiPoisson(Family):
            resid\_dev_i = sign(Y_i - \mu_i) * \sqrt{2 *
                           (Y_i * \log(Y_i / \mu_i) - (Y_i - \mu_i))} / scale
         """
-        endog_mu = self._clean(endog / mu)
         return (np.sign(endog - mu) *
-                np.sqrt(2 * (endog * np.log(endog_mu) - (endog - mu))) / scale)
+                np.sqrt(2 * (special.xlogy(endog, endog / mu) - (endog - mu))) /
+                scale)
 
     def deviance(self, endog, mu, freq_weights=1., scale=1.):
         r'''
@@ -531,8 +506,7 @@ class QuasiPoisson(Family):
 
            D = 2 * \sum_i (freq\_weights_i * Y_i * \log(Y_i / \mu_i))/ scale
         '''
-        endog_mu = self._clean(endog / mu)
-        return 2 * np.sum(endog * freq_weights * np.log(endog_mu)) / scale
+        return 2 * np.sum(freq_weights * special.xlogy(endog, endog / mu)) / scale
 
     def loglike(self, endog, mu, freq_weights=1., scale=1.):
         r"""
@@ -658,7 +632,8 @@ class Gaussian(Family):
 
            D = \sum_i freq\_weights_i * (Y_i - \mu_i)^2 / scale
         """
-        return np.sum((freq_weights * (endog - mu)**2)) / scale
+        resid = endog - mu
+        return np.vdot(resid, freq_weights * resid) / scale
 
     def loglike(self, endog, mu, freq_weights=1., scale=1.):
         r"""
@@ -706,7 +681,8 @@ class Gaussian(Family):
         if isinstance(self.link, L.Power) and self.link.power == 1:
             # This is just the loglikelihood for classical OLS
             nobs2 = endog.shape[0] / 2.
-            SSR = np.sum((endog-self.fitted(mu))**2, axis=0)
+            resid = endog - self.fitted(mu)
+            SSR = np.einsum('i...,i...->...', resid, resid)
             llf = -np.log(SSR) * nobs2
             llf -= (1+np.log(np.pi/nobs2))*nobs2
             return llf
@@ -985,6 +961,14 @@ class Binomial(Family):
         else:
             return endog, np.ones(endog.shape[0])
 
+    def _binary_llf(self, endog, mu):
+        """
+        Log-likelihood of each observation of binary endog; log(mu) where
+        endog is 1 and log1p(-mu) where it is 0, with mu trimmed to (eps, 1-eps)
+        """
+        mu = np.clip(mu, FLOAT_EPS, 1. - FLOAT_EPS)
+        return np.where(np.equal(endog, 1), np.log(mu), np.log1p(-mu))
+
     def deviance(self, endog, mu, freq_weights=1, scale=1., axis=None):
         r'''
         Deviance function for either Bernoulli or Binomial data.
@@ -1029,15 +1013,14 @@ class Binomial(Family):
         where :math:`Y_i` and :math:`n` are as defined in Binomial.initialize.
         '''
         if np.shape(self.n) == () and self.n == 1:
-            one = np.equal(endog, 1)
-            return -2 * np.sum((one * np.log(mu + 1e-200) + (1-one) *
-                               np.log(1 - mu + 1e-200)) * freq_weights, axis=axis)
+            return -2 * np.sum(self._binary_llf(endog, mu) * freq_weights,
+                               axis=axis)
 
         else:
             return 2 * np.sum(self.n * freq_weights *
-                              (endog * np.log(endog/mu + 1e-200) +
-                               (1 - endog) * np.log((1 - endog) /
-                               (1 - mu) + 1e-200)), axis=axis)
+                              (special.xlogy(endog, endog / mu) +
+                               special.xlogy(1 - endog, (1 - endog) /
+                                             (1 - mu))), axis=axis)
 
     def resid_dev(self, endog, mu, scale=1.):
         r"""
@@ -1082,17 +1065,15 @@ class Binomial(Family):
         where :math:`Y_i` and :math:`n` are as defined in Binomial.initialize.
         """
 
-        mu = self.link._clean(mu)
         if np.shape(self.n) == () and self.n == 1:
-            one = np.equal(endog, 1)
-            return np.sign(endog-mu)*np.sqrt(-2 *
-                                             np.log(one * mu + (1 - one) *
-                                                    (1 - mu)))/scale
+            return (np.sign(endog - mu) *
+                    np.sqrt(-2 * self._binary_llf(endog, mu)) / scale)
         else:
+            mu = self.link._clean(mu)
             return (np.sign(endog - mu) *
                     np.sqrt(2 * self.n *
-                            (endog * np.log(endog/mu + 1e-200) +
-                             (1 - endog) * np.log((1 - endog)/(1 - mu) + 1e-200)))/scale)
+                            (special.xlogy(endog, endog / mu) +
+                             special.xlogy(1 - endog, (1 - endog) / (1 - mu))))/scale)
 
     def loglike(self, endog, mu, freq_weights=1, scale=1.):
         r"""
@@ -1138,8 +1119,7 @@ class Binomial(Family):
         """
 
         if np.shape(self.n) == () and self.n == 1:
-            return scale * np.sum((endog * np.log(mu/(1 - mu) + 1e-200) +
-                                   np.log(1 - mu)) * freq_weights)
+            return scale * np.sum(self._binary_llf(endog, mu) * freq_weights)
         else:
             y = endog * self.n  # convert back to successes
             return scale * np.sum((special.gammaln(self.n + 1) -
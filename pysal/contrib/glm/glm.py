@@ -1,6 +1,6 @@
 
 import numpy as np
-import numpy.linalg as la
+from scipy.linalg import cho_factor, cho_solve
 from pysal.spreg.utils import RegressionPropsY, spdot
 import pysal.spreg.user_output as USER
 from utils import cache_readonly
@@ -30,14 +30,22 @@ class GLM(RegressionPropsY):
                         the expected size of the outcome in spatial epidemiology.
                         Default is None where Ni becomes 1.0 for all locations.
         y_fix         : array
-                        n*1, the fix intercept value of y
+                        n*1, the fix intercept value of y. Default is None
+                        where it becomes 0.0 for all locations.
+        dtype         : numpy dtype
+                        float precision of y, X, offset and y_fix during
+                        estimation; default is np.float64. np.float32 is meant
+                        for well-conditioned Gaussian fits; Binomial fits with
+                        probabilities near 0 or 1 should stay in float64, and
+                        tol should not be set below float32 precision.
 
     Attributes
     ----------
         y             : array
                         n*1, dependent variable.
         X             : array
-                        n*k, independent variable, including constant.
+                        n*k, independent variable, including constant;
+                        dense arrays are stored C-contiguous as dtype.
         family        : string
                         Model type: 'Gaussian', 'Poisson', 'logistic'
         n             : integer
@@ -74,29 +82,34 @@ class GLM(RegressionPropsY):
 
     """
     def __init__(self, y, X, family=family.Gaussian(), offset=None, y_fix = None,
-            constant=True):
+            constant=True, dtype=np.float64):
         """
         Initialize class
         """
         self.n = USER.check_arrays(y, X)
         USER.check_y(y, self.n)
-        self.y = y
+        self.y = np.asarray(y, dtype=dtype)
         if constant:
             self.X = USER.check_constant(X)
         else:
             self.X = X
+        if isinstance(self.X, np.ndarray):
+            # convert once so that each IWLS iteration hands BLAS a contiguous
+            # float array instead of casting or copying X internally
+            self.X = np.ascontiguousarray(self.X, dtype=dtype)
         self.family = family
         self.k = self.X.shape[1]
         self.df_model = self.X.shape[1] - 1
         self.df_resid = self.n - self.df_model - 1
+        # scalar defaults broadcast like the n*1 arrays they stand for
         if offset is None:
-            self.offset = np.ones(shape=(self.n,1))
+            self.offset = 1.0
         else:
-            self.offset = offset * 1.0
+            self.offset = np.asarray(offset, dtype=dtype)
         if y_fix is None:
-	        self.y_fix = np.zeros(shape=(self.n,1))
+	        self.y_fix = 0.0
         else:
-	        self.y_fix = y_fix
+	        self.y_fix = np.asarray(y_fix, dtype=dtype)
         self.fit_params = {}
 
     def fit(self, ini_betas=None, tol=1.0e-6, max_iter=200, solve='iwls'):
@@ -119,14 +132,16 @@ class GLM(RegressionPropsY):
                        Technique to solve MLE equations.
                        'iwls' = iteratively (re)weighted least squares (default)
         """
+        if solve.lower() != 'iwls':
+            raise ValueError("Unsupported solve technique: %s; only 'iwls' "
+                    "is currently available" % solve)
         self.fit_params['ini_betas'] = ini_betas
         self.fit_params['tol'] = tol
         self.fit_params['max_iter'] = max_iter
         self.fit_params['solve']=solve
-        if solve.lower() == 'iwls':
-            params, predy, w, n_iter = iwls(self.y, self.X, self.family, self.offset, 
-                    self.y_fix, ini_betas, tol, max_iter)
-            self.fit_params['n_iter'] = n_iter
+        params, predy, w, n_iter = iwls(self.y, self.X, self.family, self.offset, 
+                self.y_fix, ini_betas, tol, max_iter)
+        self.fit_params['n_iter'] = n_iter
         return GLMResults(self, params.flatten(), predy, w)
 
 
@@ -261,7 +276,7 @@ class GLMResults(LikelihoodModelResults):
     def __init__(self, model, params, mu, w):
         self.model = model
         self.n = model.n
-        self.y = model.y.T.flatten()
+        self.y = np.array(model.y, dtype=np.float64).ravel()
         self.X = model.X
         self.k = model.k
         self.offset = model.offset
@@ -271,9 +286,13 @@ class GLMResults(LikelihoodModelResults):
         self.fit_params = model.fit_params
         self.params = params
         self.w = w
-        self.mu = mu.flatten()
+        self.mu = np.array(mu, dtype=np.float64).ravel()
         self._cache = {}
-        self.normalized_cov_params = la.inv(spdot(self.w.T, self.w))
+
+    @cache_readonly
+    def normalized_cov_params(self):
+        xtwx = spdot(self.w.T, self.w)
+        return cho_solve(cho_factor(xtwx), np.eye(self.k))
 
     @cache_readonly
     def resid_response(self):
@@ -281,7 +300,7 @@ class GLMResults(LikelihoodModelResults):
 
     @cache_readonly
     def resid_pearson(self):
-        return  ((self.y-self.mu) /
+        return  (self.resid_response /
                 np.sqrt(self.family.variance(self.mu)))
 
     @cache_readonly
@@ -298,9 +317,8 @@ class GLMResults(LikelihoodModelResults):
 
     @cache_readonly
     def pearson_chi2(self):
-        chisq = (self.y - self.mu)**2 / self.family.variance(self.mu)
-        chisqsum = np.sum(chisq)
-        return chisqsum
+        resid = self.resid_response
+        return np.dot(resid / self.family.variance(self.mu), resid)
 
     @cache_readonly
     def null(self):
@@ -315,9 +333,7 @@ class GLMResults(LikelihoodModelResults):
         if isinstance(self.family, (family.Binomial, family.Poisson)):
             return 1.
         else:
-            return (((np.power(self.resid_response, 2) /
-                         self.family.variance(self.mu))).sum() /
-                        (self.df_resid))
+            return self.pearson_chi2 / self.df_resid
     @cache_readonly
     def deviance(self):
         return self.family.deviance(self.y, self.mu)
@@ -336,10 +352,9 @@ class GLMResults(LikelihoodModelResults):
     
     @cache_readonly
     def aic(self):
-        if isinstance(self.family, family.QuasiPoisson):
-        	return np.nan
-        else:
-            return -2 * self.llf + 2*(self.df_model+1)
+        # families without a likelihood, such as QuasiPoisson, return a NaN
+        # llf, which carries through to the AIC
+        return -2 * self.llf + 2*(self.df_model+1)
 
     @cache_readonly
     def bic(self):
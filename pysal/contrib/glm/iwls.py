@@ -1,7 +1,7 @@
 import numpy as np
-import numpy.linalg as la
 from scipy import sparse as sp
 from scipy.sparse import linalg as spla
+from scipy.linalg import cho_factor, cho_solve
 from pysal.spreg.utils import spdot, spmultiply
 from family import Binomial
 
@@ -15,24 +15,29 @@ def _compute_betas(y, x):
     """
     xT = x.T
     xtx = spdot(xT, x)
-    xtx_inv = la.inv(xtx)
-    xtx_inv = sp.csr_matrix(xtx_inv)
-    xTy = spdot(xT, y, array_out=False)
-    betas = spdot(xtx_inv, xTy)
+    xTy = spdot(xT, y)
+    # xtx and xTy are formed internally from the model arrays on every
+    # iteration, so the input scans of check_finite are skipped
+    betas = cho_solve(cho_factor(xtx, check_finite=False), xTy,
+            check_finite=False)
     return betas
 
 def _compute_betas_gwr(y, x, wi):
     """
     compute MLE coefficients using iwls routine
 
+    wi is the n*1 column of kernel weights for the calibration point; it is
+    broadcast across the columns of x rather than expanded to an n*n diagonal
+    matrix.
+
     Methods: p189, Iteratively (Re)weighted Least Squares (IWLS),
     Fotheringham, A. S., Brunsdon, C., & Charlton, M. (2002).
     Geographically weighted regression: the analysis of spatially varying relationships.
     """
-    xT = np.dot(x.T, wi)
+    xT = (x * wi).T
     xtx = np.dot(xT, x)
-    xtx_inv = la.inv(xtx)
-    xtx_inv_xt = np.dot(xtx_inv, xT)
+    xtx_inv_xt = cho_solve(cho_factor(xtx, check_finite=False), xT,
+            check_finite=False)
     betas = np.dot(xtx_inv_xt, y)
     return betas, xtx_inv_xt
 
@@ -40,6 +45,10 @@ def iwls(y, x, family, offset, y_fix,
     ini_betas=None, tol=1.0e-8, max_iter=200, wi=None):
     """
     Iteratively re-weighted least squares estimation routine
+
+    Returns betas, mu, wx, n_iter; when the local kernel weights wi are given
+    it returns betas, mu, v, w, z, xtx_inv_xt, n_iter instead so that callers
+    can unpack each by name.
     """
     #spx = sp.csr_matrix(x)
     #dx = np.float(spx.nnz)/np.float(np.multiply(*spx.shape))
@@ -49,15 +58,19 @@ def iwls(y, x, family, offset, y_fix,
         y = family.link._clean(y)
     
     if ini_betas is None:
-        betas = np.zeros((x.shape[1], 1), np.float)
+        betas = np.zeros((x.shape[1], 1), x.dtype)
     else:
         betas = ini_betas
     mu = family.starting_mu(y)
     v = family.predict(mu)
+    # working residuals are written into the same buffer on every iteration
+    resid = np.empty(np.broadcast(y, mu).shape, np.result_type(y, mu))
     while diff > tol and n_iter < max_iter:
         n_iter += 1
         w = family.weights(mu)
-        z = v + (family.link.deriv(mu)*(y-mu))
+        np.subtract(y, mu, out=resid)
+        resid *= family.link.deriv(mu)
+        z = v + resid
         w = np.sqrt(w)
         if type(x) != np.ndarray:
         	w = sp.csr_matrix(w)
@@ -4,6 +4,7 @@ Defines the link functions to be used with GLM and GEE families.
 
 import numpy as np
 import scipy.stats
+from utils import _approx_deriv, _approx_deriv_cs
 FLOAT_EPS = np.finfo(float).eps
 
 
@@ -69,9 +70,7 @@ class Link(object):
 
         implemented through numerical differentiation
         """
-        from statsmodels.tools.numdiff import approx_fprime_cs
-        # TODO: workaround proplem with numdiff for 1d
-        return np.diag(approx_fprime_cs(p, self.deriv))
+        return _approx_deriv_cs(self.deriv, p)
 
     def inverse_deriv(self, z):
         """
@@ -626,10 +625,9 @@ class CDFLink(Logit):
 
         implemented through numerical differentiation
         """
-        from statsmodels.tools.numdiff import approx_fprime
         p = np.atleast_1d(p)
         # Note: special function for norm.ppf does not support complex
-        return np.diag(approx_fprime(p, self.deriv, centered=True))
+        return _approx_deriv(self.deriv, p)
 
     def inverse_deriv(self, z):
         """
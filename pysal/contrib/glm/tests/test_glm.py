@@ -8,10 +8,12 @@ __author__ = 'Taylor Oshan tayoshan@gmail.com'
 
 from pysal.contrib.glm.glm import GLM
 from pysal.contrib.glm.family import Gaussian, Poisson, Binomial, QuasiPoisson
+from pysal.contrib.glm.iwls import iwls
 import numpy as np
 import pysal
 import unittest
 import math
+import pickle
 
 
 class TestGaussian(unittest.TestCase):
@@ -155,6 +157,30 @@ class TestGaussian(unittest.TestCase):
         self.assertAlmostEqual(results.D2, .349514377851)
         self.assertAlmostEqual(results.adj_D2, 0.32123239427957673)
 
+    def testSolve(self):
+        model = GLM(self.y, self.X, family=Gaussian())
+        self.assertRaises(ValueError, model.fit, solve='newton')
+        self.assertEqual(model.fit_params, {})
+
+    def testFloat32(self):
+        model = GLM(self.y, self.X, family=Gaussian(), dtype=np.float32)
+        results = model.fit(tol=1.0e-5)
+        self.assertEqual(results.params.dtype, np.float32)
+        np.testing.assert_allclose(results.params, [ 46.42818268,   0.62898397,
+            -0.48488854], rtol=1.0e-4)
+        np.testing.assert_allclose(results.deviance, 10647.015074206196,
+                rtol=1.0e-4)
+
+    def testPickle(self):
+        model = GLM(self.y, self.X, family=Gaussian())
+        results = model.fit()
+        results.bse
+        copied = pickle.loads(pickle.dumps(results, pickle.HIGHEST_PROTOCOL))
+        np.testing.assert_allclose(copied.params, results.params)
+        np.testing.assert_allclose(copied.bse, results.bse)
+        refit = pickle.loads(pickle.dumps(model)).fit()
+        np.testing.assert_allclose(refit.params, results.params)
+
 class TestPoisson(unittest.TestCase):
 
     def setUp(self):
@@ -989,5 +1015,30 @@ class TestBinomial(unittest.TestCase):
 
 
 
+class TestIWLSGWR(unittest.TestCase):
+    """
+    Tests for the locally weighted IWLS used to calibrate GWR
+    """
+
+    def setUp(self):
+        db = pysal.open(pysal.examples.get_path('columbus.dbf'),'r')
+        y = np.array(db.by_col("HOVAL"))
+        self.y = np.reshape(y, (49,1))
+        X = []
+        X.append(db.by_col("INC"))
+        X.append(db.by_col("CRIME"))
+        self.X = np.hstack([np.ones((49,1)), np.array(X).T])
+        x = np.array(db.by_col("X"))
+        d = np.abs(x - x[0]).reshape((-1,1))
+        self.wi = np.exp(-0.5 * (d / d.max())**2)
+
+    def testGaussian(self):
+        params, mu, v, w, z, xtx_inv_xt, n_iter = iwls(self.y, self.X,
+                Gaussian(), 1.0, 0.0, wi=self.wi, max_iter=1)
+        XtW = (self.X * self.wi).T
+        betas = np.linalg.solve(np.dot(XtW, self.X), np.dot(XtW, self.y))
+        np.testing.assert_allclose(params, betas)
+        np.testing.assert_allclose(np.dot(xtx_inv_xt, self.y), betas)
+
 if __name__ == '__main__':
 	unittest.main()
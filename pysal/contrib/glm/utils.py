@@ -281,10 +281,35 @@ else:
         return np.sum(S > tol)
 
 
+EPS = np.finfo(float).eps
+
+def _approx_deriv_cs(f, x):
+    """
+    Complex step derivative of a function f that is applied elementwise to x
+
+    This is the diagonal of the numerical Jacobian of f, obtained from a single
+    evaluation of f instead of one evaluation per element of x.
+    """
+    x = np.asarray(x, dtype=float)
+    h = EPS * np.maximum(np.abs(x), 0.1)
+    return f(x + 1j * h).imag / h
+
+def _approx_deriv(f, x):
+    """
+    Centered finite difference derivative of a function f that is applied
+    elementwise to x; for functions that do not accept complex input
+    """
+    x = np.asarray(x, dtype=float)
+    h = EPS**(1. / 3) * np.maximum(np.abs(x), 0.1) / 2.
+    return (f(x + h) - f(x - h)) / (2 * h)
+
 
 class CacheWriteWarning(UserWarning):
     pass
 
+# sentinel marking an attribute that has not been computed yet
+_missing = object()
+
 class CachedAttribute(object):
 
     def __init__(self, func, cachename=None, resetlist=None):
@@ -296,34 +321,14 @@ class CachedAttribute(object):
     def __get__(self, obj, type=None):
         if obj is None:
             return self.fget
-        # Get the cache or set a default one if needed
-        _cachename = self.cachename
-        _cache = getattr(obj, _cachename, None)
-        if _cache is None:
-            setattr(obj, _cachename, resettable_cache())
-            _cache = getattr(obj, _cachename)
-        # Get the name of the attribute to set and cache
+        # The cache dict is created by the owning class's __init__
+        _cache = getattr(obj, self.cachename)
         name = self.name
-        _cachedval = _cache.get(name, None)
-        # print("[_cachedval=%s]" % _cachedval)
-        if _cachedval is None:
-            # Call the "fget" function
+        _cachedval = _cache.get(name, _missing)
+        if _cachedval is _missing:
+            # Call the "fget" function and store the result, even if it is None
             _cachedval = self.fget(obj)
-            # Set the attribute in obj
-            # print("Setting %s in cache to %s" % (name, _cachedval))
-            try:
-                _cache[name] = _cachedval
-            except KeyError:
-                setattr(_cache, name, _cachedval)
-            # Update the reset list if needed (and possible)
-            resetlist = self.resetlist
-            if resetlist is not ():
-                try:
-                    _cache._resetdict[name] = self.resetlist
-                except AttributeError:
-                    pass
-        # else:
-        # print("Reading %s from cache (%s)" % (name, _cachedval))
+            _cache[name] = _cachedval
         return _cachedval
 
     def __set__(self, obj, value):
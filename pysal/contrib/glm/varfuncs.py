@@ -5,6 +5,7 @@ Variance functions for use with the link functions in statsmodels.family.links
 __docformat__ = 'restructuredtext'
 
 import numpy as np
+from utils import _approx_deriv, _approx_deriv_cs
 FLOAT_EPS = np.finfo(float).eps
 
 class VarianceFunction(object):
@@ -43,16 +44,14 @@ class VarianceFunction(object):
             ones(mu.shape)
         """
         mu = np.asarray(mu)
-        return np.ones(mu.shape, np.float64)
+        return np.ones(mu.shape, np.result_type(mu.dtype, np.float32))
 
 
     def deriv(self, mu):
         """
         Derivative of the variance function v'(mu)
         """
-        from statsmodels.tools.numdiff import approx_fprime_cs
-        # TODO: diag workaround proplem with numdiff for 1d
-        return np.diag(approx_fprime_cs(mu, self))
+        return _approx_deriv_cs(self, mu)
 
 
 constant = VarianceFunction()
@@ -112,10 +111,8 @@ class Power(object):
         """
         Derivative of the variance function v'(mu)
         """
-        from statsmodels.tools.numdiff import approx_fprime_cs, approx_fprime
-        #return approx_fprime_cs(mu, self)  # TODO fix breaks in `fabs
-        # TODO: diag is workaround problem with numdiff for 1d
-        return np.diag(approx_fprime(mu, self))
+        # complex step breaks in `fabs`
+        return _approx_deriv(self, mu)
 
 
 mu = Power()
@@ -201,9 +198,7 @@ class Binomial(object):
         """
         Derivative of the variance function v'(mu)
         """
-        from statsmodels.tools.numdiff import approx_fprime_cs, approx_fprime
-        # TODO: diag workaround proplem with numdiff for 1d
-        return np.diag(approx_fprime_cs(mu, self))
+        return _approx_deriv_cs(self, mu)
 
 
 binary = Binomial()
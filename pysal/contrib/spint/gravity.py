@@ -16,6 +16,7 @@ Wilson, A. G. (1967). A statistical theory of spatial distribution models.
 __author__ = "Taylor Oshan tayoshan@gmail.com"
 
 from types import FunctionType
+import multiprocessing as mp
 import numpy as np
 from scipy import sparse as sp
 from pysal.spreg import user_output as User
@@ -170,7 +171,7 @@ class BaseGravity(CountModel):
                             "requires the logarithm of the cost variable which"
                             "is undefined at 0")
             elif cost_func.lower() == 'exp':
-                self.cf = lambda x: x*1.0
+                self.cf = _exp_cost
         elif (type(cost_func) == FunctionType) | (type(cost_func) == np.ufunc):
             self.cf = cost_func
         else:
@@ -275,6 +276,29 @@ class BaseGravity(CountModel):
     def SRMSE(self):
         return srmse(self)
 
+    def _local(self, model_type, subsets, covs, cores=False):
+        """
+        Calibrate a local model of model_type for each tuple of positional
+        arguments in subsets and collect the diagnostics by name
+        """
+        if cores:
+            pool = mp.Pool(None)
+            fits = [pool.apply_async(_local_work, args=(model_type, args))
+                    for args in subsets]
+            pool.close()
+            pool.join()
+            fits = [fit.get() for fit in fits]
+        else:
+            fits = [_local_work(model_type, args) for args in subsets]
+        results = {}
+        for stat in _LOCAL_STATS:
+            results[stat] = [fit[0][stat] for fit in fits]
+        for cov in range(covs):
+            results['param' + str(cov)] = [fit[1][cov] for fit in fits]
+            results['pvalue' + str(cov)] = [fit[2][cov] for fit in fits]
+            results['tvalue' + str(cov)] = [fit[3][cov] for fit in fits]
+        return results
+
     def reshape(self, array):
         if type(array) == np.ndarray:
             return array.reshape((-1,1))
@@ -430,7 +454,7 @@ class Gravity(BaseGravity):
                 cost_func=cost_func, o_vars=self.ov, d_vars=self.dv, constant=constant,
                 framework=framework, SF=SF, CD=CD, Lag=Lag, Quasi=Quasi)
         
-    def local(self, loc_index, locs):
+    def local(self, loc_index, locs, cores=False):
         """
         Calibrate local models for subsets of data from a single location to all
         other locations
@@ -448,47 +472,27 @@ class Gravity(BaseGravity):
                       or destinations. If all origins are also destinations and
                       a local model is desired for each location then use
                       np.unique(loc_index)
+        cores       : boolean
+                      Specifies if multiprocessing is to be used; local models
+                      are then calibrated in parallel using all available
+                      cores. Requires a picklable cost function. Default is
+                      False
 
         Returns
         -------
         results     : dict where keys are names of model outputs and diagnostics
                       and values are lists of location specific values. 
         """
-        results = {}
         covs = self.ov.shape[1] + self.dv.shape[1] + 1
-        results['AIC'] = []
-        results['deviance'] = []
-        results['pseudoR2'] = []
-        results['adj_pseudoR2'] = []
-        results['D2'] = []
-        results['adj_D2'] = []
-        results['SSI'] = []
-        results['SRMSE'] = []
-        for cov in range(covs):
-            results['param' + str(cov)] = []
-            results['pvalue' + str(cov)] = []
-            results['tvalue' + str(cov)] = []
+        subsets = []
         for loc in locs:
             subset = loc_index == loc
             f = self.reshape(self.f[subset])
             o_vars = self.ov[subset.reshape(self.ov.shape[0]),:]
             d_vars = self.dv[subset.reshape(self.dv.shape[0]),:]
             dij = self.reshape(self.c[subset])
-            model = Gravity(f, o_vars, d_vars, dij, self.cf,
-                    constant=False)
-            results['AIC'].append(model.AIC)
-            results['deviance'].append(model.deviance)
-            results['pseudoR2'].append(model.pseudoR2)
-            results['adj_pseudoR2'].append(model.adj_pseudoR2)
-            results['D2'].append(model.D2)
-            results['adj_D2'].append(model.adj_D2)
-            results['SSI'].append(model.SSI)
-            results['SRMSE'].append(model.SRMSE)
-            for cov in range(covs):
-                results['param' + str(cov)].append(model.params[cov])
-                results['pvalue' + str(cov)].append(model.pvalues[cov])
-                results['tvalue' + str(cov)].append(model.tvalues[cov])
-        return results
+            subsets.append((f, o_vars, d_vars, dij, self.cf))
+        return self._local(Gravity, subsets, covs, cores)
 
 class Production(BaseGravity):
     """
@@ -635,7 +639,7 @@ class Production(BaseGravity):
                 origins=self.o, constant=constant, framework=framework,
                 SF=SF, CD=CD, Lag=Lag, Quasi=Quasi)
     
-    def local(self, locs=None):
+    def local(self, locs=None, cores=False):
         """
         Calibrate local models for subsets of data from a single location to all
         other locations
@@ -644,48 +648,29 @@ class Production(BaseGravity):
         ----------
         locs        : iterable of location (origins) labels; default is
                       None which calibrates a local model for each origin
+        cores       : boolean
+                      Specifies if multiprocessing is to be used; local models
+                      are then calibrated in parallel using all available
+                      cores. Requires a picklable cost function. Default is
+                      False
 
         Returns
         -------
         results     : dict where keys are names of model outputs and diagnostics
                       and values are lists of location specific values
         """
-        results = {}
         covs = self.dv.shape[1] + 1
-        results['AIC'] = []
-        results['deviance'] = []
-        results['pseudoR2'] = []
-        results['adj_pseudoR2'] = []
-        results['D2'] = []
-        results['adj_D2'] = []
-        results['SSI'] = []
-        results['SRMSE'] = []
-        for cov in range(covs):
-            results['param' + str(cov)] = []
-            results['pvalue' + str(cov)] = []
-            results['tvalue' + str(cov)] = []
         if locs is None:
         	locs = np.unique(self.o)
+        subsets = []
         for loc in np.unique(locs):
             subset = self.o == loc
             f = self.reshape(self.f[subset])
             o = self.reshape(self.o[subset])
             d_vars = self.dv[subset.reshape(self.dv.shape[0]),:]
             dij = self.reshape(self.c[subset])
-            model = Production(f, o, d_vars, dij, self.cf, constant=False)
-            results['AIC'].append(model.AIC)
-            results['deviance'].append(model.deviance)
-            results['pseudoR2'].append(model.pseudoR2)
-            results['adj_pseudoR2'].append(model.adj_pseudoR2)
-            results['D2'].append(model.D2)
-            results['adj_D2'].append(model.adj_D2)
-            results['SSI'].append(model.SSI)
-            results['SRMSE'].append(model.SRMSE)
-            for cov in range(covs):
-                results['param' + str(cov)].append(model.params[cov])
-                results['pvalue' + str(cov)].append(model.pvalues[cov])
-                results['tvalue' + str(cov)].append(model.tvalues[cov])
-        return results
+            subsets.append((f, o, d_vars, dij, self.cf))
+        return self._local(Production, subsets, covs, cores)
 
 class Attraction(BaseGravity):
     """
@@ -830,7 +815,7 @@ class Attraction(BaseGravity):
                  destinations=self.d, constant=constant,
                  framework=framework, SF=SF, CD=CD, Lag=Lag, Quasi=Quasi)
 
-    def local(self, locs=None):
+    def local(self, locs=None, cores=False):
         """
         Calibrate local models for subsets of data from a single location to all
         other locations
@@ -839,48 +824,29 @@ class Attraction(BaseGravity):
         ----------
         locs        : iterable of location (destinations) labels; default is
                       None which calibrates a local model for each destination
+        cores       : boolean
+                      Specifies if multiprocessing is to be used; local models
+                      are then calibrated in parallel using all available
+                      cores. Requires a picklable cost function. Default is
+                      False
 
         Returns
         -------
         results     : dict where keys are names of model outputs and diagnostics
                       and values are lists of location specific values
         """
-        results = {}
         covs = self.ov.shape[1] + 1
-        results['AIC'] = []
-        results['deviance'] = []
-        results['pseudoR2'] = []
-        results['adj_pseudoR2'] = []
-        results['D2'] = []
-        results['adj_D2'] = []
-        results['SSI'] = []
-        results['SRMSE'] = []
-        for cov in range(covs):
-            results['param' + str(cov)] = []
-            results['pvalue' + str(cov)] = []
-            results['tvalue' + str(cov)] = []
         if locs is  None:
         	locs = np.unique(self.d)
+        subsets = []
         for loc in np.unique(locs):
             subset = self.d == loc
             f = self.reshape(self.f[subset])
             d = self.reshape(self.d[subset])
             o_vars = self.ov[subset.reshape(self.ov.shape[0]),:]
             dij = self.reshape(self.c[subset])
-            model = Attraction(f, d, o_vars, dij, self.cf, constant=False)
-            results['AIC'].append(model.AIC)
-            results['deviance'].append(model.deviance)
-            results['pseudoR2'].append(model.pseudoR2)
-            results['adj_pseudoR2'].append(model.adj_pseudoR2)
-            results['D2'].append(model.D2)
-            results['adj_D2'].append(model.adj_D2)
-            results['SSI'].append(model.SSI)
-            results['SRMSE'].append(model.SRMSE)
-            for cov in range(covs):
-                results['param' + str(cov)].append(model.params[cov])
-                results['pvalue' + str(cov)].append(model.pvalues[cov])
-                results['tvalue' + str(cov)].append(model.tvalues[cov])
-        return results
+            subsets.append((f, d, o_vars, dij, self.cf))
+        return self._local(Attraction, subsets, covs, cores)
 
 class Doubly(BaseGravity):
     """
@@ -1037,3 +1003,19 @@ class Doubly(BaseGravity):
         """
         raise NotImplementedError("Local models not possible for"
         " doubly-constrained model due to insufficient degrees of freedom.")
+
+
+_LOCAL_STATS = ['AIC', 'deviance', 'pseudoR2', 'adj_pseudoR2', 'D2', 'adj_D2',
+        'SSI', 'SRMSE']
+
+def _exp_cost(x):
+    return x*1.0
+
+def _local_work(model_type, args):
+    """
+    Calibrate a single local model; defined at module level so that it can be
+    dispatched to a multiprocessing pool
+    """
+    model = model_type(*args, constant=False)
+    stats = dict((stat, getattr(model, stat)) for stat in _LOCAL_STATS)
+    return stats, model.params, model.pvalues, model.tvalues
@@ -389,6 +389,14 @@ class TestGravity(unittest.TestCase):
                                                 'D2',
                                                 'pseudoR2', 
                                                 'param2'].sort())
+
+    def test_local_Production_cores(self):
+        model = grav.Production(self.f, self.o, self.d_var, self.dij, 'exp')
+        local = model.local(locs=np.unique(self.o))
+        local_mp = model.local(locs=np.unique(self.o), cores=True)
+        self.assertEqual(sorted(local.keys()), sorted(local_mp.keys()))
+        for key in local:
+            np.testing.assert_allclose(local_mp[key], local[key])
                                                   
     def test_Attraction(self):
         model = grav.Production(self.f, self.d, self.o_var,
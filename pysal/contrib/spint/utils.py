@@ -43,10 +43,9 @@ def sorensen(model):
     except:
         yhat = model.mu.reshape((-1,1))
     N = model.n
-    YYhat = np.hstack([y, yhat])
-    num = 2.0 * np.min(YYhat, axis = 1)
+    num = 2.0 * np.minimum(y, yhat)
     den = yhat + y
-    return (1.0/N) * (np.sum(num.reshape((-1,1))/den.reshape((-1,1))))
+    return (1.0/N) * (np.sum(num/den))
     
 def srmse(model):
     """
@@ -61,7 +60,8 @@ def srmse(model):
         yhat = model.yhat.reshape((-1,1))
     except:
         yhat = model.mu.reshape((-1,1))
-    srmse = ((np.sum((y-yhat)**2)/n)**.5)/(np.sum(y)/n)
+    resid = (y-yhat).ravel()
+    srmse = ((np.dot(resid, resid)/n)**.5)/(np.sum(y)/n)
     return srmse
 
 def spcategorical(index):
@@ -330,6 +330,31 @@ class KNN(W):
         else:
             return KNN(data, ids=ids, k=k, p=p)
 
+# kernel functions of the standardized distance z, following Anselin and Rey
+# (2010) table 5.4
+def _triangular(z):
+    return 1 - z
+
+def _uniform(z):
+    return np.ones(z.shape) * 0.5
+
+def _quadratic(z):
+    return (3. / 4) * (1 - z ** 2)
+
+def _quartic(z):
+    return (15. / 16) * (1 - z ** 2) ** 2
+
+def _gaussian(z):
+    c = np.pi * 2
+    c = c ** (-0.5)
+    return c * np.exp(-(z ** 2) / 2.)
+
+_KERNEL_FUNCTIONS = {'triangular': _triangular,
+                     'uniform': _uniform,
+                     'quadratic': _quadratic,
+                     'quartic': _quartic,
+                     'gaussian': _gaussian}
+
 class Kernel(W):
     """
     Spatial weights based on kernel functions.
@@ -504,6 +529,8 @@ class Kernel(W):
             self.kdt = KDTree(self.data)
         self.k = k + 1
         self.function = function.lower()
+        if self.function not in _KERNEL_FUNCTIONS:
+            raise ValueError('Unsupported kernel function: %s' % function)
         self.fixed = fixed
         self.eps = eps
         if bandwidth:
@@ -641,24 +668,19 @@ class Kernel(W):
             if not isinstance(di, np.ndarray):
                 di = np.asarray([di] * len(nids))
                 ni = np.asarray([ni] * len(nids))
-            zi = np.array([dict(zip(ni, di))[nid] for nid in nids]) / bw[i]
-            z.append(zi)
-        zs = z
-        # functions follow Anselin and Rey (2010) table 5.4
-        if self.function == 'triangular':
-            self.kernel = [1 - zi for zi in zs]
-        elif self.function == 'uniform':
-            self.kernel = [np.ones(zi.shape) * 0.5 for zi in zs]
-        elif self.function == 'quadratic':
-            self.kernel = [(3. / 4) * (1 - zi ** 2) for zi in zs]
-        elif self.function == 'quartic':
-            self.kernel = [(15. / 16) * (1 - zi ** 2) ** 2 for zi in zs]
-        elif self.function == 'gaussian':
-            c = np.pi * 2
-            c = c ** (-0.5)
-            self.kernel = [c * np.exp(-(zi ** 2) / 2.) for zi in zs]
-        else:
-            print('Unsupported kernel function', self.function)
+            # reorder the query distances to follow nids
+            order = np.argsort(ni)
+            pos = np.searchsorted(ni, nids, sorter=order)
+            pos = order[np.minimum(pos, len(ni) - 1)]
+            if not np.array_equal(ni[pos], nids):
+                raise KeyError('neighbors of observation %d are missing from '
+                               'its nearest neighbor query' % i)
+            z.append(di[pos] / bw[i])
+        # evaluate the kernel over all neighbor pairs at once and split the
+        # result back into one array per observation
+        splits = np.cumsum([len(zi) for zi in z])[:-1]
+        kernel = _KERNEL_FUNCTIONS[self.function](np.concatenate(z))
+        self.kernel = np.split(kernel, splits)
 
 
 class DistanceBand(W):
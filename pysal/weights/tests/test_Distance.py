@@ -282,6 +282,49 @@ class Test_Kernel(ut.TestCase, Distance_Mixin):
         bws = w.bandwidth.tolist()
         np.testing.assert_allclose(bws, self.known_w4_abws, rtol=RTOL)
 
+    def test_functions(self):
+        known = {('triangular', True): {0: 0.2094306640148389,
+                                        1: 0.500000049999995,
+                                        2: 0.500000049999995,
+                                        3: 0.4696699671430927,
+                                        4: 1.0,
+                                        5: 0.6464466447620618},
+                 ('triangular', False): {1: 0.0571910526988314,
+                                         2: 0.0571910526988314,
+                                         3: 9.99999900663795e-08,
+                                         4: 1.0,
+                                         5: 0.33333339999999345},
+                 ('quartic', True): {0: 0.13183602539062664,
+                                     1: 0.5273438203124919,
+                                     2: 0.5273438203124919,
+                                     3: 0.4843140406494058,
+                                     4: 0.9375,
+                                     5: 0.7177734785156196},
+                 ('quartic', False): {1: 0.011574111111135212,
+                                      2: 0.011574111111135212,
+                                      3: 3.749998880278275e-14,
+                                      4: 0.9375,
+                                      5: 0.2893519444444381},
+                 ('gaussian', True): {0: 0.29187242563132504,
+                                      1: 0.35206533556593145,
+                                      2: 0.35206533556593145,
+                                      3: 0.34660706954091997,
+                                      4: 0.3989422804014327,
+                                      5: 0.37477159420234657},
+                 ('gaussian', False): {1: 0.2557939890461616,
+                                       2: 0.2557939890461616,
+                                       3: 0.2419707487162134,
+                                       4: 0.3989422804014327,
+                                       5: 0.31944801972003956}}
+        for (function, fixed), known_w in known.items():
+            w = d.Kernel(self.points, k=4, function=function, fixed=fixed)
+            self.assertEqual(sorted(w[4].keys()), sorted(known_w.keys()))
+            for k, v in w[4].items():
+                np.testing.assert_allclose(v, known_w[k], rtol=RTOL)
+
+    def test_unsupported_function(self):
+        self.assertRaises(ValueError, d.Kernel, self.points, function='cosine')
+
 knn = ut.TestLoader().loadTestsFromTestCase(Test_KNN)
 kern = ut.TestLoader().loadTestsFromTestCase(Test_Kernel)
 db = ut.TestLoader().loadTestsFromTestCase(Test_DistanceBand)